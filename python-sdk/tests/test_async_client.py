@@ -0,0 +1,57 @@
+"""
+Tests for AsyncVectisClient against a local aiohttp server.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+
+from vectis import AsyncVectisClient, VectisConnectionError
+
+
+def _run(handler, call, **client_kwargs):
+    """Serve ``handler`` on /api/batch_get and run ``call(client)`` against it."""
+    async def run():
+        app = web.Application()
+        app.router.add_post('/api/batch_get', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncVectisClient(f'http://127.0.0.1:{port}', **client_kwargs) as client:
+                return await call(client)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+async def _batch_get(request):
+    """Answer with JSON values for all but the last key, labelled text/plain."""
+    keys = (await request.json())['keys']
+    values = ['' if k == 'missing' else f'v-{k}' for k in keys[:-1]]
+    return web.Response(text=json.dumps({'values': values}))
+
+
+async def _slow(request):
+    """Answer only after the client's timeout has expired."""
+    await asyncio.sleep(2)
+    return web.json_response({'values': []})
+
+
+def test_abatch_get_keeps_every_key():
+    """Keys are never dropped, whatever the response Content-Type."""
+    results = _run(_batch_get, lambda client: client.abatch_get(['a', 'missing', 'b', 'c'], chunk_size=2))
+    assert results == {'a': 'v-a', 'missing': None, 'b': 'v-b', 'c': None}
+
+
+def test_timeout_raises_connection_error():
+    """A request exceeding the client timeout surfaces as VectisConnectionError."""
+    with pytest.raises(VectisConnectionError):
+        _run(_slow, lambda client: client.abatch_get(['a']), timeout=0.2)
@@ -0,0 +1,50 @@
+"""
+Tests for EmbeddingCache.
+"""
+
+import time
+
+import numpy as np
+
+from vectis import EmbeddingCache
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    """Entries beyond max_entries are evicted oldest-access first."""
+    with EmbeddingCache(':memory:', max_entries=2) as cache:
+        cache.put('a', 'm', [1.0, 2.0])
+        cache.put('b', 'm', [3.0, 4.0])
+        cache.put('a', 'm', [5.0, 6.0])
+        assert len(cache) == 2
+
+        cache.put('c', 'm', [7.0, 8.0])
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.get('b', 'm') is None
+        np.testing.assert_array_equal(cache.get('a', 'm'), [5.0, 6.0])
+
+
+def test_purge_model_updates_count():
+    """Purging a model removes only its entries."""
+    with EmbeddingCache(':memory:') as cache:
+        cache.put('a', 'old', [1.0])
+        cache.put('a', 'new', [2.0])
+        assert cache.purge_model('old') == 1
+        assert len(cache) == 1
+        assert cache.get('a', 'old') is None
+
+
+def test_get_refreshes_access_order(tmp_path, monkeypatch):
+    """A hit protects an entry from eviction, even within one clock tick and across reopening."""
+    monkeypatch.setattr(time, 'time', lambda: 1000.0)
+    path = str(tmp_path / 'cache.db')
+    with EmbeddingCache(path, max_entries=2) as cache:
+        cache.put('a', 'm', [1.0])
+        cache.put('b', 'm', [2.0])
+        assert cache.get('a', 'm') is not None
+
+    with EmbeddingCache(path, max_entries=2) as cache:
+        cache.put('c', 'm', [3.0])
+        assert cache.get('b', 'm') is None
+        assert cache.get('a', 'm') is not None
+        assert len(cache) == 2
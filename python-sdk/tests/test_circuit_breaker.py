@@ -0,0 +1,61 @@
+"""
+Tests for the client's circuit breaker.
+"""
+
+import pytest
+
+from vectis import client as client_module
+from vectis.client import _CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic in vectis.client."""
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_opens_after_fail_max_consecutive_failures(clock):
+    """Requests are refused once fail_max failures happen in a row."""
+    breaker = _CircuitBreaker(fail_max=3, reset_timeout=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_half_open_trial_success_closes_circuit(clock):
+    """After reset_timeout one trial is allowed; success closes the circuit."""
+    breaker = _CircuitBreaker(fail_max=1, reset_timeout=10)
+    breaker.record_failure()
+    clock[0] += 9
+    assert not breaker.allow()
+
+    clock[0] += 1
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_half_open_trial_failure_reopens_circuit(clock):
+    """A failed trial opens the circuit for another reset_timeout."""
+    breaker = _CircuitBreaker(fail_max=2, reset_timeout=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock[0] += 10
+    assert breaker.allow()
+
+    breaker.record_failure()
+    clock[0] += 5
+    assert not breaker.allow()
+    clock[0] += 5
+    assert breaker.allow()
@@ -0,0 +1,107 @@
+"""
+Tests for VectisClient against a stubbed HTTP session.
+"""
+
+import io
+import json
+
+import numpy as np
+import pytest
+import requests
+from urllib3 import HTTPResponse
+
+from vectis import VectisClient, VectisConnectionError, Vector
+from vectis.client import FVECS_CONTENT_TYPE, NDJSON_CONTENT_TYPE, _iter_ndjson
+
+
+def _stream(body: bytes, content_type: str = NDJSON_CONTENT_TYPE,
+            truncated: bool = False) -> requests.Response:
+    """Build a streamed requests.Response over ``body``, optionally cut short mid-body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = content_type
+    length = len(body) + (100 if truncated else 0)
+    response.raw = HTTPResponse(io.BytesIO(body), headers={'Content-Length': str(length)},
+                                preload_content=False, enforce_content_length=True)
+    return response
+
+
+def _response(status: int, body: bytes, content_type: str) -> requests.Response:
+    """Build a requests.Response with a fixed body."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers['Content-Type'] = content_type
+    return response
+
+
+@pytest.mark.parametrize('dtype', ['f4', 'f2', 'i8'])
+def test_get_vector_binary_roundtrip(monkeypatch, dtype):
+    """get_vector returns the served values for every binary storage dtype."""
+    values = [0.1, -0.5, 0.25]
+    body = Vector(values, dtype=dtype).to_bytes()
+
+    def request(session, method, url, **kwargs):
+        if url.endswith('/api/vector/get'):
+            return _response(200, body, FVECS_CONTENT_TYPE)
+        return _response(200, b'{}', 'application/json')
+
+    monkeypatch.setattr(requests.Session, 'request', request)
+    client = VectisClient('http://localhost:8080', binary_vectors=True)
+
+    tolerance = {'f4': 1e-7, 'f2': 1e-3, 'i8': 5e-3}[dtype]
+    # The second call is answered from the vector cache
+    for _ in range(2):
+        vec = client.get_vector('k')
+        assert vec.dtype == dtype
+        np.testing.assert_allclose(vec.to_numpy(), values, atol=tolerance)
+
+    client.close()
+
+
+def test_iter_ndjson_lines_longer_than_read_buffer():
+    """Lines spanning several reads, including ones over 64 KiB, decode intact."""
+    items = [{'key': 'a', 'value': 'x' * 200_000}, {'key': 'b', 'value': ''},
+             {'key': 'c', 'value': 'y' * 70_000}]
+    body = b'\n'.join(json.dumps(item).encode() for item in items)
+
+    assert list(_iter_ndjson(_stream(body))) == items
+
+
+def test_iter_ndjson_interleaved_streams():
+    """Streams consumed in lockstep, or one inside another, do not corrupt each other."""
+    first = [{'key': f'a{i}', 'value': 'x' * (i % 50)} for i in range(3000)]
+    second = [{'key': f'b{i}', 'value': 'y' * (i % 70)} for i in range(3000)]
+
+    def body(items):
+        return b'\n'.join(json.dumps(item).encode() for item in items)
+
+    pairs = list(zip(_iter_ndjson(_stream(body(first))), _iter_ndjson(_stream(body(second)))))
+    assert pairs == list(zip(first, second))
+
+    outer = []
+    for item in _iter_ndjson(_stream(body(first))):
+        outer.append(item)
+        if len(outer) == 1:
+            assert list(_iter_ndjson(_stream(body(second)))) == second
+    assert outer == first
+
+
+@pytest.mark.parametrize('content_type', [NDJSON_CONTENT_TYPE, 'application/json'])
+def test_dropped_stream_raises_connection_error(monkeypatch, content_type):
+    """A connection lost mid-body surfaces as VectisConnectionError."""
+    body = b'{"key": "a", "value": "1"}\n{"key": "b"'
+
+    def request(session, method, url, **kwargs):
+        if url.endswith('/api/scan'):
+            return _stream(body, content_type, truncated=True)
+        return _response(200, b'{}', 'application/json')
+
+    monkeypatch.setattr(requests.Session, 'request', request)
+    client = VectisClient('http://localhost:8080')
+
+    with pytest.raises(VectisConnectionError):
+        list(client.scan_iter('a', 'z'))
+    assert client._breaker._failures == 1
+
+    client.close()
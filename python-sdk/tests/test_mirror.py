@@ -0,0 +1,88 @@
+"""
+Tests for LocalMirror.
+"""
+
+import numpy as np
+import pytest
+
+from vectis.mirror import LocalMirror
+
+
+def _vectors(n, dim=8, seed=0):
+    """Random float32 vectors keyed k0..k{n-1}."""
+    rng = np.random.default_rng(seed)
+    return {f'k{i}': rng.standard_normal(dim).astype(np.float32) for i in range(n)}
+
+
+def _brute_force(vectors, query, k):
+    """Reference cosine-distance search."""
+    q = query / np.linalg.norm(query)
+    dists = {key: 1.0 - float(v @ q / np.linalg.norm(v)) for key, v in vectors.items()}
+    return sorted(dists.items(), key=lambda item: item[1])[:k]
+
+
+def test_brute_force_search_matches_reference():
+    """Below the threshold results are exact cosine distances."""
+    vectors = _vectors(20)
+    mirror = LocalMirror(threshold=100)
+    for key, v in vectors.items():
+        mirror.add(key, v)
+
+    query = vectors['k3'] + 0.1
+    results = mirror.search(query, 5)
+    expected = _brute_force(vectors, query, 5)
+    assert [key for key, _ in results] == [key for key, _ in expected]
+    np.testing.assert_allclose([d for _, d in results], [d for _, d in expected], atol=1e-6)
+    assert len(mirror.search(query, 100)) == 20
+
+
+def test_remove_moves_last_row_into_freed_slot():
+    """Removing a key keeps every other key searchable under its own vector."""
+    vectors = _vectors(10)
+    mirror = LocalMirror()
+    for key, v in vectors.items():
+        mirror.add(key, v)
+
+    mirror.remove('k2')
+    mirror.remove('missing')
+    del vectors['k2']
+    assert len(mirror) == 9
+    for key, v in vectors.items():
+        assert mirror.search(v, 1)[0][0] == key
+
+
+def test_dimension_mismatch_is_ignored():
+    """Vectors of another dimension are not mirrored."""
+    mirror = LocalMirror()
+    assert mirror.dimension is None
+    mirror.add('a', np.ones(4, dtype=np.float32))
+    mirror.add('b', np.ones(8, dtype=np.float32))
+    assert mirror.dimension == 4
+    assert len(mirror) == 1
+
+
+def test_hnsw_index_tracks_replace_and_remove():
+    """Above the threshold the HNSW index agrees with brute force after updates."""
+    pytest.importorskip('usearch')
+    vectors = _vectors(200)
+    mirror = LocalMirror(threshold=50)
+    for key, v in vectors.items():
+        mirror.add(key, v)
+    mirror.search(vectors['k0'], 1)
+    index = mirror._index
+    assert index is not None
+
+    vectors['k3'] = vectors['k7'] * 2
+    mirror.add('k3', vectors['k3'])
+    for key in ('k5', 'k199'):
+        mirror.remove(key)
+        del vectors[key]
+
+    assert mirror._index is index
+    for key in ('k0', 'k3', 'k100', 'k198'):
+        results = mirror.search(vectors[key], 3)
+        expected = _brute_force(vectors, vectors[key], 3)
+        assert {k for k, _ in results} == {k for k, _ in expected}
+        # float32 storage keeps distances as precise as the brute-force path
+        np.testing.assert_allclose(sorted(d for _, d in results),
+                                   sorted(d for _, d in expected), atol=1e-5)
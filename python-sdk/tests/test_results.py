@@ -0,0 +1,14 @@
+"""
+Tests for SearchResults.
+"""
+
+from vectis import SearchResults
+
+
+def test_distances_keep_full_precision():
+    """Results compare equal to the list of tuples they were built from."""
+    pairs = [('a', 0.1), ('b', 0.30000000000000004)]
+    results = SearchResults.from_pairs(pairs)
+    assert results == pairs
+    assert results[0] == ('a', 0.1)
+    assert list(results) == pairs
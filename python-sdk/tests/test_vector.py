@@ -0,0 +1,81 @@
+"""
+Tests for Vector.
+"""
+
+import numpy as np
+import pytest
+
+from vectis import Vector
+
+
+def test_borrowed_array_changes_are_not_hidden_by_cached_norm():
+    """A vector wrapping the caller's array sees later writes to it."""
+    arr = np.array([3.0, 4.0], dtype=np.float32)
+    v = Vector(arr)
+    assert v.norm() == pytest.approx(5.0)
+
+    arr *= 2
+    assert v.norm() == pytest.approx(10.0)
+    assert v.cosine_similarity(Vector([3.0, 4.0])) == pytest.approx(1.0)
+
+
+def test_normalize_in_place_leaves_caller_array_untouched():
+    """In-place normalization of a borrowed array works on a private copy."""
+    arr = np.array([3.0, 4.0], dtype=np.float32)
+    v = Vector(arr).normalize(in_place=True)
+
+    np.testing.assert_array_equal(arr, [3.0, 4.0])
+    np.testing.assert_allclose(v.to_numpy(), [0.6, 0.8])
+
+    arr[:] = 100
+    assert v.cosine_similarity(Vector([3.0, 4.0]).normalize()) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('dtype', ['f4', 'f2', 'i8'])
+def test_from_normalized_bytes_is_writable(dtype):
+    """Vectors decoded from immutable bytes can still be modified."""
+    buf = Vector([3.0, 4.0], dtype=dtype).normalize().to_bytes()
+    v = Vector.from_normalized_bytes(buf)
+    assert v.normalized
+
+    v[0] = 1.0
+    assert not v.normalized
+    v.normalize(in_place=True)
+    assert v.norm() == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('dim', [16, 128])
+def test_batch_methods_match_numpy(dim):
+    """Batch scores match NumPy on both the small-dimension kernel and BLAS paths."""
+    rng = np.random.default_rng(0)
+    mat = rng.standard_normal((100, dim)).astype(np.float32)
+    q = rng.standard_normal(dim).astype(np.float32)
+    v = Vector(q)
+
+    expected_cos = (mat @ q) / (np.linalg.norm(mat, axis=1) * np.linalg.norm(q))
+    expected_l2 = np.linalg.norm(mat - q, axis=1)
+    np.testing.assert_allclose(v.cosine_similarity_batch(mat), expected_cos, atol=1e-5)
+    np.testing.assert_allclose(v.euclidean_distance_batch(mat), expected_l2, atol=1e-4)
+
+
+@pytest.mark.parametrize('shape', [(4, 16), (4, 64), (32,)])
+def test_batch_methods_reject_dimension_mismatch(shape):
+    """A matrix whose rows do not match the vector's dimension is rejected."""
+    v = Vector(np.ones(32, dtype=np.float32))
+    mat = np.ones(shape, dtype=np.float32)
+    with pytest.raises(ValueError):
+        v.cosine_similarity_batch(mat)
+    with pytest.raises(ValueError):
+        v.euclidean_distance_batch(mat)
+
+
+@pytest.mark.parametrize('dtype', ['f4', 'f2', 'i8'])
+def test_getitem_matches_dequantized_values(dtype):
+    """Indexing, slicing and iteration return the dequantized float32 values."""
+    v = Vector([0.1, -0.5, 0.25, 1.0], dtype=dtype)
+    values = v.to_numpy()
+
+    assert v[1] == values[1]
+    assert isinstance(v[1], np.float32)
+    np.testing.assert_array_equal(v[1:3], values[1:3])
+    np.testing.assert_array_equal(list(v), values)
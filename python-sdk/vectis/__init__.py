@@ -32,6 +32,8 @@ __author__ = "Vectis Team"
 
 from .client import VectisClient, VectisError, VectisConnectionError, VectisNotFoundError
 from .vector import Vector
+from .cache import EmbeddingCache
+from .results import SearchResults
 
 __all__ = [
     "VectisClient",
@@ -39,4 +41,13 @@ __all__ = [
     "VectisConnectionError",
     "VectisNotFoundError",
     "Vector",
+    "EmbeddingCache",
+    "SearchResults",
 ]
+
+# AsyncVectisClient requires the optional aiohttp dependency
+try:
+    from .async_client import AsyncVectisClient
+    __all__.append("AsyncVectisClient")
+except ImportError:
+    pass
@@ -0,0 +1,75 @@
+"""
+Numba-compiled distance kernels for Vectis Python SDK.
+
+Used by Vector's batch methods for small dimensions, where BLAS dispatch and
+temporary arrays dominate the cost of the NumPy implementation. Requires the
+optional ``numba`` dependency (``pip install vectis[numba]``); when it is not
+installed ``load`` returns None and the NumPy path is used instead.
+
+numba is imported on the first ``load`` call rather than with the package, so
+``import vectis`` does not pay for it. The kernels are deliberately serial:
+Numba's parallel ``workqueue`` threading layer aborts the process when called
+from several threads at once, and VectisClient is meant to be shared by threads.
+"""
+
+import math
+import threading
+from typing import Callable, Optional, Tuple
+
+# Dimensions below which the compiled kernels replace the NumPy/BLAS path
+MAX_DIM = 64
+
+_kernels: Optional[Tuple[Callable, Callable]] = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def _compile() -> Optional[Tuple[Callable, Callable]]:
+    """Import numba and define the kernels, or return None if it is missing."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(nogil=True, fastmath=True, cache=True)
+    def cosine_batch(q, mat, out):
+        """Write the cosine similarity of ``q`` with each row of ``mat`` into ``out``."""
+        for i in range(mat.shape[0]):
+            s = 0.0
+            na = 0.0
+            nb = 0.0
+            for j in range(q.shape[0]):
+                a = q[j]
+                b = mat[i, j]
+                s += a * b
+                na += a * a
+                nb += b * b
+            out[i] = s / (math.sqrt(na * nb) + 1e-12)
+
+    @njit(nogil=True, fastmath=True, cache=True)
+    def euclidean_batch(q, mat, out):
+        """Write the Euclidean distance from ``q`` to each row of ``mat`` into ``out``."""
+        for i in range(mat.shape[0]):
+            s = 0.0
+            for j in range(q.shape[0]):
+                d = q[j] - mat[i, j]
+                s += d * d
+            out[i] = math.sqrt(s)
+
+    return cosine_batch, euclidean_batch
+
+
+def load() -> Optional[Tuple[Callable, Callable]]:
+    """
+    Return the ``(cosine_batch, euclidean_batch)`` kernels, compiling them on first use.
+
+    Returns:
+        Kernel pair, or None when numba is not installed
+    """
+    global _kernels, _loaded
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                _kernels = _compile()
+                _loaded = True
+    return _kernels
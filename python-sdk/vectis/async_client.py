@@ -0,0 +1,179 @@
+"""
+Vectis Database Async Python Client
+
+Provides an asyncio interface for issuing many batch and search requests
+concurrently against a Vectis server. Requires the optional ``aiohttp``
+dependency (``pip install vectis[async]``).
+"""
+
+import asyncio
+import aiohttp
+import orjson
+import numpy as np
+from typing import Optional, List, Dict, Any, Union
+
+from .client import VectisError, VectisConnectionError
+from .results import SearchResults
+from .vector import Vector
+
+
+class AsyncVectisClient:
+    """
+    Async Vectis Database Client
+
+    Splits large batch operations into chunks and dispatches them concurrently
+    over a shared connection pool.
+
+    Args:
+        base_url: Base URL of the Vectis server (e.g., "http://localhost:8080")
+        timeout: Request timeout in seconds (default: 30)
+        limit: Maximum number of simultaneous connections (default: 64)
+
+    Example:
+        >>> async with AsyncVectisClient("http://localhost:8080") as client:
+        ...     await client.abatch_put({"user:1": "Alice", "user:2": "Bob"})
+        ...     values = await client.abatch_get(["user:1", "user:2"])
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8080", timeout: int = 30, limit: int = 64):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.limit = limit
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session on first use (must run inside the event loop)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                timeout=self.timeout
+            )
+        return self._session
+
+    async def _post(self, endpoint: str, semaphore: asyncio.Semaphore,
+                    payload: Dict[str, Any], parse: bool = True) -> Any:
+        """POST a JSON payload and return the decoded JSON body (None if empty or unparsed)."""
+        url = self.base_url + endpoint
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+        async with semaphore:
+            try:
+                async with self._get_session().post(
+                    url, data=body, headers={'Content-Type': 'application/json'}
+                ) as response:
+                    if response.status != 200:
+                        raise VectisError(f"POST {endpoint} failed: {await response.text()}")
+                    content = await response.read()
+            except aiohttp.ClientError as e:
+                raise VectisConnectionError(f"Request failed: {e}")
+            except asyncio.TimeoutError:
+                raise VectisConnectionError(f"Request to {endpoint} timed out")
+
+        # Parse whatever the Content-Type header says, like the sync client
+        if not parse or not content.strip():
+            return None
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            raise VectisError(f"POST {endpoint} returned invalid JSON: {e}")
+
+    @staticmethod
+    def _chunks(seq: List[Any], chunk_size: int) -> List[List[Any]]:
+        """Split a list into consecutive chunks of at most ``chunk_size`` elements."""
+        return [seq[i:i + chunk_size] for i in range(0, len(seq), chunk_size)]
+
+    async def abatch_put(self, items: Dict[str, str], chunk_size: int = 1000,
+                         concurrency: int = 16) -> None:
+        """
+        Store many key-value pairs using concurrent batch requests.
+
+        Items are sorted by value length before chunking so that each request
+        carries a similar payload size.
+
+        Args:
+            items: Dictionary of key-value pairs to store
+            chunk_size: Maximum number of operations per request
+            concurrency: Maximum number of requests in flight
+
+        Raises:
+            VectisError: If any chunk fails
+        """
+        operations = [
+            {"type": "PUT", "key": k, "value": v}
+            for k, v in sorted(items.items(), key=lambda kv: len(kv[1]))
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        await asyncio.gather(*[
+            self._post('/api/batch', semaphore, {'operations': chunk}, parse=False)
+            for chunk in self._chunks(operations, chunk_size)
+        ])
+
+    async def abatch_get(self, keys: List[str], chunk_size: int = 1000,
+                         concurrency: int = 16) -> Dict[str, Optional[str]]:
+        """
+        Retrieve many values using concurrent batch requests.
+
+        Args:
+            keys: List of keys to retrieve
+            chunk_size: Maximum number of keys per request
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Dictionary mapping keys to values (None for missing keys)
+        """
+        chunks = self._chunks(keys, chunk_size)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        responses = await asyncio.gather(*[
+            self._post('/api/batch_get', semaphore, {'keys': chunk})
+            for chunk in chunks
+        ])
+
+        results: Dict[str, Optional[str]] = dict.fromkeys(keys)
+        for chunk, data in zip(chunks, responses):
+            values = (data or {}).get('values', [])
+            results.update({k: v if v else None for k, v in zip(chunk, values)})
+        return results
+
+    async def asearch_similar_batch(self, queries: List[Union[List[float], np.ndarray, Vector]],
+                                    k: int = 10,
+                                    concurrency: int = 16) -> List[SearchResults]:
+        """
+        Run several k-nearest-neighbor searches concurrently.
+
+        Args:
+            queries: List of query vectors (lists of floats, numpy arrays or Vectors)
+            k: Number of results to return per query
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            One SearchResults of (key, distance) pairs per query, in query order
+        """
+        vectors = [query if isinstance(query, Vector) else Vector(query) for query in queries]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        responses = await asyncio.gather(*[
+            self._post('/api/vector/search', semaphore, {'query': vec.to_numpy(), 'k': k})
+            for vec in vectors
+        ])
+
+        return [
+            SearchResults.from_pairs([(item['key'], item['distance'])
+                                      for item in (data or {}).get('results', [])])
+            for data in responses
+        ]
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
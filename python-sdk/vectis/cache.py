@@ -0,0 +1,182 @@
+"""
+Persistent embedding cache for Vectis Python SDK.
+
+Stores embeddings on disk keyed by a hash of the source text and the model
+that produced them, so embeddings survive process restarts and do not have to
+be regenerated.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import numpy as np
+from typing import Optional, Dict, Union, List
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache of text embeddings.
+
+    Keys are a 16-byte BLAKE2b digest of the text followed by the model id.
+    Embeddings are stored as float16 to halve their size on disk and are
+    returned as float32.
+
+    Args:
+        path: Path of the SQLite database file (":memory:" for a throwaway cache)
+        max_entries: Maximum number of cached embeddings; the least recently
+            used entries are evicted beyond this (default: None, unbounded)
+
+    Example:
+        >>> cache = EmbeddingCache("embeddings.db")
+        >>> cache.put("hello world", "all-MiniLM-L6-v2", embedding)
+        >>> cache.get("hello world", "all-MiniLM-L6-v2")
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key BLOB PRIMARY KEY,"
+            " model_id TEXT NOT NULL,"
+            " embedding BLOB NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_access ON embeddings(last_access)"
+        )
+        self._conn.commit()
+
+        # Running row count, so bounded caches need no COUNT(*) scan per insert
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+        # Strictly increasing access counter used as last_access; unlike wall-clock
+        # time it never ties within a clock tick or steps backwards
+        self._clock = self._conn.execute(
+            "SELECT COALESCE(MAX(last_access), 0) FROM embeddings"
+        ).fetchone()[0]
+
+    def _tick(self) -> float:
+        """Advance and return the access counter (lock held)."""
+        self._clock += 1
+        return self._clock
+
+    @staticmethod
+    def _key(text: str, model_id: str) -> bytes:
+        """Build the cache key for a piece of text embedded by a given model."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() + model_id.encode('utf-8')
+
+    def get(self, text: str, model_id: str) -> Optional[np.ndarray]:
+        """
+        Look up a cached embedding.
+
+        Args:
+            text: Source text
+            model_id: Identifier of the embedding model
+
+        Returns:
+            float32 embedding, or None if not cached
+        """
+        key = self._key(text, model_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT embedding FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            # Access order only matters when entries can be evicted
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?", (self._tick(), key)
+                )
+                self._conn.commit()
+        return np.frombuffer(row[0], dtype='<f2').astype(np.float32)
+
+    def put(self, text: str, model_id: str, embedding: Union[List[float], np.ndarray]) -> None:
+        """
+        Store an embedding.
+
+        Args:
+            text: Source text
+            model_id: Identifier of the embedding model
+            embedding: Embedding values
+        """
+        value = np.asarray(embedding, dtype=np.float32).ravel().astype('<f2').tobytes()
+        key = self._key(text, model_id)
+        with self._lock:
+            tick = self._tick()
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO embeddings (key, model_id, embedding, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, model_id, value, tick)
+            )
+            if cursor.rowcount:
+                self._count += 1
+            else:
+                self._conn.execute(
+                    "UPDATE embeddings SET embedding = ?, last_access = ? WHERE key = ?",
+                    (value, tick, key)
+                )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond ``max_entries`` (lock held)."""
+        if self.max_entries is None or self._count <= self.max_entries:
+            return
+        cursor = self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN ("
+            " SELECT key FROM embeddings ORDER BY last_access LIMIT ?)",
+            (self._count - self.max_entries,)
+        )
+        self._count -= cursor.rowcount
+        self.evictions += cursor.rowcount
+
+    def purge_model(self, model_id: str) -> int:
+        """
+        Remove every embedding produced by a model, e.g. after migrating to a new one.
+
+        Args:
+            model_id: Identifier of the embedding model to purge
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM embeddings WHERE model_id = ?", (model_id,))
+            self._conn.commit()
+            self._count -= cursor.rowcount
+            return cursor.rowcount
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Cache hit, miss and eviction counters since the cache was opened."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def __len__(self) -> int:
+        """Number of cached embeddings."""
+        return self._count
+
+    def close(self):
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -4,13 +4,143 @@ Vectis Database Python Client
 Provides a high-level interface for interacting with Vectis database over HTTP.
 """
 
-import json
+import struct
+import threading
+import time
+import orjson
+import numpy as np
 import requests
-from typing import Optional, List, Tuple, Dict, Any
-from urllib.parse import urljoin, urlencode
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from requests.adapters import HTTPAdapter
+from typing import Optional, List, Tuple, Dict, Any, Iterator, Callable, Union
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
 
+from .cache import EmbeddingCache
+from .mirror import LocalMirror
+from .results import SearchResults
 from .vector import Vector
 
+# Zstandard content-encoding is optional (pip install vectis[zstd])
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Endpoint names accepted by VectisClient._request and their URL paths
+ENDPOINTS = {
+    'put': '/api/put',
+    'get': '/api/get',
+    'delete': '/api/delete',
+    'batch': '/api/batch',
+    'batch_get': '/api/batch_get',
+    'scan': '/api/scan',
+    'vector_put': '/api/vector/put',
+    'vector_get': '/api/vector/get',
+    'vector_search': '/api/vector/search',
+    'stats': '/api/stats',
+    'health': '/api/health',
+}
+
+FVECS_CONTENT_TYPE = 'application/x-fvecs'
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+# Pool of read buffers for streamed responses; each stream holds one exclusively
+_READ_BUFFER_SIZE = 64 * 1024
+_MAX_POOLED_BUFFERS = 32
+_read_buffers: List[bytearray] = []
+
+# Errors raised when the connection drops while a streamed body is being read
+_BODY_READ_ERRORS = (requests.exceptions.RequestException, URLLib3HTTPError)
+
+# Newer urllib3 releases decode zstd bodies themselves when zstandard is installed
+_URLLIB3_DECODES_ZSTD = 'zstd' in getattr(HTTPResponse, 'CONTENT_DECODERS', [])
+
+
+def _needs_zstd_decode(response: requests.Response) -> bool:
+    """Check whether a zstd-encoded body must be decompressed by the client."""
+    return (zstandard is not None and not _URLLIB3_DECODES_ZSTD
+            and 'zstd' in response.headers.get('Content-Encoding', ''))
+
+
+def _content(response: requests.Response) -> bytes:
+    """Return the decoded response body, decompressing zstd if needed."""
+    if _needs_zstd_decode(response):
+        return zstandard.ZstdDecompressor().decompressobj().decompress(response.content)
+    return response.content
+
+
+def _acquire_read_buffer() -> bytearray:
+    """Take a read buffer out of the pool, allocating one if the pool is empty."""
+    try:
+        return _read_buffers.pop()
+    except IndexError:
+        return bytearray(_READ_BUFFER_SIZE)
+
+
+def _release_read_buffer(buf: bytearray) -> None:
+    """Return a read buffer to the pool once its stream is done with it."""
+    if len(_read_buffers) < _MAX_POOLED_BUFFERS:
+        _read_buffers.append(buf)
+
+
+def _iter_ndjson(response: requests.Response) -> Iterator[Any]:
+    """Incrementally decode a streamed NDJSON response body, one object per line."""
+    if _needs_zstd_decode(response):
+        source = zstandard.ZstdDecompressor().stream_reader(response.raw)
+    else:
+        response.raw.decode_content = True
+        source = response.raw
+    # Bytes after the last newline; grows in place so long lines are copied once
+    pending = bytearray()
+    # Held until the stream ends, so interleaved streams never share a buffer
+    buf = _acquire_read_buffer()
+    view = memoryview(buf)
+    
+    try:
+        while True:
+            n = source.readinto(buf)
+            if not n:
+                break
+            end = buf.rfind(b'\n', 0, n)
+            if end < 0:
+                pending += view[:n]
+                continue
+            pending += view[:end]
+            for line in pending.split(b'\n'):
+                if line.strip():
+                    yield orjson.loads(line)
+            pending[:] = view[end + 1:n]
+        if pending.strip():
+            yield orjson.loads(pending)
+    finally:
+        view.release()
+        _release_read_buffer(buf)
+        response.close()
+
+
+def _decode_search_results(buf: bytes) -> SearchResults:
+    """
+    Decode a binary search response.
+    
+    Layout (little-endian): uint32 count, then per result a uint32 key length,
+    the UTF-8 key bytes and a float32 distance.
+    """
+    (count,) = struct.unpack_from('<I', buf)
+    offset = 4
+    keys, dists = [], []
+    for _ in range(count):
+        (key_len,) = struct.unpack_from('<I', buf, offset)
+        offset += 4
+        keys.append(buf[offset:offset + key_len].decode('utf-8'))
+        offset += key_len
+        dists.append(struct.unpack_from('<f', buf, offset)[0])
+        offset += 4
+    return SearchResults(keys, dists)
+
 
 class VectisError(Exception):
     """Base exception for Vectis client errors."""
@@ -27,6 +157,47 @@ class VectisNotFoundError(VectisError):
     pass
 
 
+class _CircuitBreaker:
+    """
+    Minimal circuit breaker guarding requests to a single server.
+    
+    After ``fail_max`` consecutive connection failures the circuit opens and
+    requests fail immediately for ``reset_timeout`` seconds. The first request
+    after that is let through as a trial; success closes the circuit again.
+    """
+    
+    def __init__(self, fail_max: int = 10, reset_timeout: float = 30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Check whether a request may be attempted."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: let one trial request through
+                self._opened_at = time.monotonic()
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+
 class VectisClient:
     """
     Vectis Database Client
@@ -36,6 +207,31 @@ class VectisClient:
     Args:
         base_url: Base URL of the Vectis server (e.g., "http://localhost:8080")
         timeout: Request timeout in seconds (default: 30)
+        pool_maxsize: Maximum number of pooled connections kept per host (default: 128)
+        cache_size: Number of search results and vectors kept in the client-side
+            LRU cache (default: 1024, 0 disables caching)
+        binary_vectors: Send and request vectors in the binary .fvecs wire format
+            instead of JSON (default: False). Falls back to JSON if the server
+            rejects the format.
+        vector_dtype: Precision used for binary vector uploads: 'f4' (default),
+            'f2' (float16) or 'i8' (int8 with scale). Only applies when
+            binary_vectors is enabled.
+        compress_threshold: Batch payloads larger than this many bytes are sent
+            zstd-compressed when the zstandard package is installed
+            (default: 64 KiB, 0 disables)
+        max_batch_size: Largest number of items sent in one batch request; bigger
+            batches are split into chunks (default: 1000)
+        max_concurrency: Number of chunk requests dispatched in parallel (default: 8)
+        timeouts: Per-endpoint timeout overrides in seconds, keyed by path
+            (e.g. {'/api/scan': 120}); other endpoints use ``timeout``
+        embedding_cache: Persistent cache consulted by ``get_or_put_vector``
+            before calling the embedding function (default: None)
+        local_mirror: Keep an in-process copy of vectors written through this
+            client and answer ``search_similar`` from it using cosine distance
+            (default: False). Only suitable when this client writes the whole
+            collection.
+        mirror_threshold: Mirror size above which an HNSW index (requires the
+            usearch package) replaces brute-force search (default: 1000)
         
     Example:
         >>> client = VectisClient("http://localhost:8080")
@@ -45,10 +241,60 @@ class VectisClient:
         value1
     """
     
-    def __init__(self, base_url: str = "http://localhost:8080", timeout: int = 30):
+    def __init__(self, base_url: str = "http://localhost:8080", timeout: int = 30,
+                 pool_maxsize: int = 128, cache_size: int = 1024,
+                 binary_vectors: bool = False, vector_dtype: str = 'f4',
+                 compress_threshold: int = 64 * 1024, max_batch_size: int = 1000,
+                 max_concurrency: int = 8, timeouts: Optional[Dict[str, float]] = None,
+                 embedding_cache: Optional[EmbeddingCache] = None,
+                 local_mirror: bool = False, mirror_threshold: int = 1000):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        
+        # Resolve every endpoint URL and timeout once instead of on each request
+        self._urls = {name: self.base_url + path for name, path in ENDPOINTS.items()}
+        self._timeouts = {name: self.timeouts.get(path, timeout) for name, path in ENDPOINTS.items()}
+        self.embedding_cache = embedding_cache
+        self._mirror = LocalMirror(mirror_threshold) if local_mirror else None
         self.session = requests.Session()
+        self.binary_vectors = binary_vectors
+        self.vector_dtype = vector_dtype
+        self.compress_threshold = compress_threshold if zstandard is not None else 0
+        
+        # Oversized batches are split and dispatched on a shared thread pool
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        # LRU caches for repeated vector lookups and searches
+        self.cache_size = cache_size
+        self._search_cache: "OrderedDict[Tuple[bytes, int], SearchResults]" = OrderedDict()
+        self._vector_cache: "OrderedDict[str, Vector]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Reuse keep-alive connections across requests and retry transient errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST']),
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'zstd, gzip' if zstandard is not None else 'gzip'
+        })
+        
+        # Fail fast once the server keeps failing instead of waiting out every timeout
+        self._breaker = _CircuitBreaker(fail_max=10, reset_timeout=30)
         
         # Test connection
         try:
@@ -57,19 +303,158 @@ class VectisClient:
             raise VectisConnectionError(f"Failed to connect to {base_url}: {e}")
     
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make HTTP request to the database."""
-        url = urljoin(self.base_url, endpoint)
+        """Make HTTP request to the database. ``endpoint`` is a key of ``ENDPOINTS``."""
+        if not self._breaker.allow():
+            raise VectisConnectionError(
+                f"Circuit open: {self.base_url} failed repeatedly, "
+                f"retrying after {self._breaker.reset_timeout}s"
+            )
         
         try:
             response = self.session.request(
                 method,
-                url,
-                timeout=self.timeout,
+                self._urls[endpoint],
+                timeout=self._timeouts[endpoint],
                 **kwargs
             )
-            return response
         except requests.exceptions.RequestException as e:
+            self._breaker.record_failure()
             raise VectisConnectionError(f"Request failed: {e}")
+        
+        self._breaker.record_success()
+        return response
+    
+    def _post_json(self, endpoint: str, payload: Dict[str, Any],
+                   headers: Optional[Dict[str, str]] = None, compress: bool = False,
+                   **kwargs) -> requests.Response:
+        """
+        POST a JSON payload, encoding numpy arrays directly from their buffers.
+        
+        With ``compress``, bodies above ``compress_threshold`` are sent with zstd
+        content-encoding; if the server rejects that with 415 the request is
+        resent uncompressed and compression is disabled for this client.
+        """
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        headers = {'Content-Type': 'application/json', **(headers or {})}
+        
+        if compress and 0 < self.compress_threshold < len(body):
+            response = self._request(
+                'POST',
+                endpoint,
+                data=zstandard.ZstdCompressor(level=3).compress(body),
+                headers={**headers, 'Content-Encoding': 'zstd'},
+                **kwargs
+            )
+            if response.status_code != 415:
+                return response
+            self.compress_threshold = 0
+        
+        return self._request('POST', endpoint, data=body, headers=headers, **kwargs)
+    
+    def _post_fvecs(self, endpoint: str, vec: Vector, params: Dict[str, Any]) -> Optional[requests.Response]:
+        """
+        POST a vector in the binary .fvecs format.
+        
+        Returns None (and disables binary mode) if the server does not accept the format.
+        """
+        if vec.dtype != self.vector_dtype:
+            vec = Vector(vec.to_numpy(), dtype=self.vector_dtype)
+        
+        response = self._request(
+            'POST',
+            endpoint,
+            params=params,
+            data=vec.to_bytes(),
+            headers={
+                'Content-Type': FVECS_CONTENT_TYPE,
+                'Accept': f'{FVECS_CONTENT_TYPE}, application/json;q=0.5'
+            }
+        )
+        if response.status_code == 415:
+            self.binary_vectors = False
+            return None
+        return response
+    
+    @staticmethod
+    def _is_fvecs(response: requests.Response) -> bool:
+        """Check whether the server answered in the binary .fvecs format."""
+        return response.headers.get('Content-Type', '').startswith(FVECS_CONTENT_TYPE)
+    
+    @staticmethod
+    def _is_ndjson(response: requests.Response) -> bool:
+        """Check whether the server answered with a streamed NDJSON body."""
+        return response.headers.get('Content-Type', '').startswith(NDJSON_CONTENT_TYPE)
+    
+    def _json(self, response: requests.Response) -> Any:
+        """Decode a JSON response body."""
+        try:
+            content = _content(response)
+        except _BODY_READ_ERRORS as e:
+            self._breaker.record_failure()
+            raise VectisConnectionError(f"Reading response failed: {e}")
+        return orjson.loads(content)
+    
+    def _iter_ndjson(self, response: requests.Response) -> Iterator[Any]:
+        """Decode a streamed NDJSON body, reporting a dropped connection like a failed request."""
+        try:
+            yield from _iter_ndjson(response)
+        except _BODY_READ_ERRORS as e:
+            self._breaker.record_failure()
+            raise VectisConnectionError(f"Reading response failed: {e}")
+    
+    def _cache_lookup(self, cache: OrderedDict, key: Any) -> Any:
+        """Return a cached entry and mark it most recently used, or None on miss."""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_store(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """Insert an entry, evicting the least recently used one when over capacity."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared chunk-dispatch thread pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix='vectis-batch'
+                )
+            return self._executor
+    
+    def _run_chunks(self, fn: Callable[[Any], Any], chunks: List[Any]) -> List[Any]:
+        """
+        Run ``fn`` on every chunk concurrently and return the results in order.
+        
+        If any chunk fails, chunks that have not started yet are cancelled and
+        the first failure is re-raised.
+        """
+        if len(chunks) == 1:
+            return [fn(chunks[0])]
+        
+        futures = [self._get_executor().submit(fn, chunk) for chunk in chunks]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+        
+        for future in futures:
+            if future in done and future.exception() is not None:
+                raise future.exception()
+        return [future.result() for future in futures]
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached vectors and search results."""
+        with self._cache_lock:
+            self._search_cache.clear()
+            self._vector_cache.clear()
     
     def put(self, key: str, value: str) -> None:
         """
@@ -84,7 +469,7 @@ class VectisClient:
         """
         response = self._request(
             'POST',
-            '/api/put',
+            'put',
             data={'key': key, 'value': value}
         )
         
@@ -103,7 +488,7 @@ class VectisClient:
         """
         response = self._request(
             'GET',
-            '/api/get',
+            'get',
             params={'key': key}
         )
         
@@ -126,20 +511,30 @@ class VectisClient:
         """
         response = self._request(
             'POST',
-            '/api/delete',
+            'delete',
             data={'key': key}
         )
         
         if response.status_code != 200:
             raise VectisError(f"DELETE failed: {response.text}")
+        
+        self.invalidate_cache()
+        if self._mirror is not None:
+            self._mirror.remove(key)
     
     def batch_put(self, items: Dict[str, str]) -> None:
         """
         Store multiple key-value pairs in a single batch operation.
         
+        Batches larger than ``max_batch_size`` are sorted by value length, split
+        into evenly weighted chunks and sent concurrently.
+        
         Args:
             items: Dictionary of key-value pairs to store
             
+        Raises:
+            VectisError: If any chunk fails
+            
         Example:
             >>> client.batch_put({
             ...     "user:1": "Alice",
@@ -147,40 +542,66 @@ class VectisClient:
             ...     "user:3": "Charlie"
             ... })
         """
+        pairs = list(items.items())
+        if len(pairs) > self.max_batch_size:
+            pairs.sort(key=lambda kv: len(kv[1]))
+        
         operations = [
             {"type": "PUT", "key": k, "value": v}
-            for k, v in items.items()
+            for k, v in pairs
         ]
         
-        response = self._request(
-            'POST',
-            '/api/batch',
-            json={'operations': operations}
-        )
+        self._run_chunks(self._batch_put_chunk, self._chunks(operations))
+    
+    def _batch_put_chunk(self, operations: List[Dict[str, str]]) -> None:
+        """Send a single batch PUT request."""
+        response = self._post_json('batch', {'operations': operations}, compress=True)
         
         if response.status_code != 200:
             raise VectisError(f"Batch PUT failed: {response.text}")
     
+    def _chunks(self, seq: List[Any]) -> List[List[Any]]:
+        """Split a list into chunks of at most ``max_batch_size`` elements."""
+        size = max(self.max_batch_size, 1)
+        return [seq[i:i + size] for i in range(0, len(seq), size)] or [seq]
+    
     def batch_get(self, keys: List[str]) -> Dict[str, Optional[str]]:
         """
         Retrieve multiple values in a single batch operation.
         
+        Key lists larger than ``max_batch_size`` are split into chunks that are
+        fetched concurrently.
+        
         Args:
             keys: List of keys to retrieve
             
         Returns:
             Dictionary mapping keys to values (None for missing keys)
         """
-        response = self._request(
-            'POST',
-            '/api/batch_get',
-            json={'keys': keys}
+        results: Dict[str, Optional[str]] = {}
+        for chunk_results in self._run_chunks(self._batch_get_chunk, self._chunks(keys)):
+            results.update(chunk_results)
+        return results
+    
+    def _batch_get_chunk(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        """Send a single batch GET request."""
+        response = self._post_json(
+            'batch_get',
+            {'keys': keys},
+            headers={'Accept': f'{NDJSON_CONTENT_TYPE}, application/json;q=0.5'},
+            stream=True
         )
         
         if response.status_code != 200:
             raise VectisError(f"Batch GET failed: {response.text}")
         
-        results = response.json()
+        if self._is_ndjson(response):
+            results: Dict[str, Optional[str]] = dict.fromkeys(keys)
+            for item in self._iter_ndjson(response):
+                results[item['key']] = item['value'] if item['value'] else None
+            return results
+        
+        results = self._json(response)
         return {k: v if v else None for k, v in zip(keys, results.get('values', []))}
     
     def scan(self, start: str, end: str, limit: int = 0, reverse: bool = False) -> List[Tuple[str, str]]:
@@ -196,43 +617,112 @@ class VectisClient:
         Returns:
             List of (key, value) tuples
         """
+        return list(self.scan_iter(start, end, limit, reverse))
+    
+    def scan_iter(self, start: str, end: str, limit: int = 0,
+                  reverse: bool = False) -> Iterator[Tuple[str, str]]:
+        """
+        Scan a range of keys, yielding entries as they arrive.
+        
+        When the server streams NDJSON the body is parsed incrementally, so
+        large scans never materialize the full response in memory.
+        
+        Args:
+            start: Start key (inclusive)
+            end: End key (exclusive)
+            limit: Maximum number of results (0 = no limit)
+            reverse: Scan in reverse order
+            
+        Yields:
+            (key, value) tuples
+        """
         params = {
             'start': start,
             'end': end,
             'limit': limit,
-            'reverse': str(reverse).lower()
+            'reverse': 1 if reverse else 0
         }
         
-        response = self._request('GET', '/api/scan', params=params)
+        response = self._request(
+            'GET',
+            'scan',
+            params=params,
+            headers={'Accept': f'{NDJSON_CONTENT_TYPE}, application/json;q=0.5'},
+            stream=True
+        )
         
         if response.status_code != 200:
             raise VectisError(f"SCAN failed: {response.text}")
         
-        results = response.json()
-        return [(item['key'], item['value']) for item in results.get('entries', [])]
+        if self._is_ndjson(response):
+            for item in self._iter_ndjson(response):
+                yield item['key'], item['value']
+            return
+        
+        results = self._json(response)
+        for item in results.get('entries', []):
+            yield item['key'], item['value']
     
-    def put_vector(self, key: str, vector: List[float]) -> None:
+    def put_vector(self, key: str, vector: Union[List[float], np.ndarray, Vector]) -> None:
         """
         Store a vector embedding.
         
         Args:
             key: The key to store the vector under
-            vector: List of floats representing the vector
+            vector: List of floats, numpy array or Vector
             
         Example:
             >>> embedding = [0.1, 0.5, 0.3, 0.8, 0.2]
             >>> client.put_vector("doc:article1", embedding)
         """
-        vec = Vector(vector)
+        vec = vector if isinstance(vector, Vector) else Vector(vector)
         
-        response = self._request(
-            'POST',
-            '/api/vector/put',
-            json={'key': key, 'vector': vec.to_list()}
-        )
+        response = None
+        if self.binary_vectors:
+            response = self._post_fvecs('vector_put', vec, {'key': key})
+        if response is None:
+            response = self._post_json('vector_put', {'key': key, 'vector': vec.to_numpy()})
         
         if response.status_code != 200:
             raise VectisError(f"Vector PUT failed: {response.text}")
+        
+        self.invalidate_cache()
+        if self._mirror is not None:
+            self._mirror.add(key, vec.to_numpy())
+    
+    def get_or_put_vector(self, key: str, text: str,
+                          embedder: Callable[[str], Union[List[float], np.ndarray]],
+                          model_id: str = 'default') -> Vector:
+        """
+        Embed text and store the vector, reusing a cached embedding when available.
+        
+        The embedding is looked up in ``embedding_cache`` by a hash of ``text``
+        and ``model_id``; ``embedder`` is only called on a cache miss.
+        
+        Args:
+            key: The key to store the vector under
+            text: Source text to embed
+            embedder: Function mapping text to an embedding
+            model_id: Identifier of the embedding model, part of the cache key
+            
+        Returns:
+            The stored vector
+            
+        Example:
+            >>> client = VectisClient(embedding_cache=EmbeddingCache("embeddings.db"))
+            >>> client.get_or_put_vector("doc:1", text, model.encode, "all-MiniLM-L6-v2")
+        """
+        embedding = None
+        if self.embedding_cache is not None:
+            embedding = self.embedding_cache.get(text, model_id)
+        if embedding is None:
+            embedding = embedder(text)
+            if self.embedding_cache is not None:
+                self.embedding_cache.put(text, model_id, embedding)
+        
+        vec = Vector(embedding)
+        self.put_vector(key, vec)
+        return vec
     
     def get_vector(self, key: str) -> Optional[Vector]:
         """
@@ -244,10 +734,19 @@ class VectisClient:
         Returns:
             Vector object, or None if not found
         """
+        cached = self._cache_lookup(self._vector_cache, key)
+        if cached is not None:
+            return Vector._from_storage(cached.data.copy(), cached.dtype, cached.scale)
+        
+        headers = {}
+        if self.binary_vectors:
+            headers['Accept'] = f'{FVECS_CONTENT_TYPE}, application/json;q=0.5'
+        
         response = self._request(
             'GET',
-            '/api/vector/get',
-            params={'key': key}
+            'vector_get',
+            params={'key': key},
+            headers=headers
         )
         
         if response.status_code == 404:
@@ -255,19 +754,28 @@ class VectisClient:
         elif response.status_code != 200:
             raise VectisError(f"Vector GET failed: {response.text}")
         
-        data = response.json()
-        return Vector(data['vector'])
+        if self._is_fvecs(response):
+            vec = Vector.from_bytes(_content(response))
+        else:
+            vec = Vector(self._json(response)['vector'])
+        self._cache_store(self._vector_cache, key, vec)
+        return Vector._from_storage(vec.data.copy(), vec.dtype, vec.scale)
     
-    def search_similar(self, query: List[float], k: int = 10) -> List[Tuple[str, float]]:
+    def search_similar(self, query: Union[List[float], np.ndarray, Vector], k: int = 10,
+                       force_remote: bool = False) -> SearchResults:
         """
         Search for k nearest neighbor vectors.
         
+        With ``local_mirror`` enabled the search is answered in-process when the
+        mirror holds at least ``k`` vectors of the query's dimension.
+        
         Args:
-            query: Query vector as list of floats
+            query: Query vector as list of floats, numpy array or Vector
             k: Number of results to return
+            force_remote: Always query the server, bypassing the local mirror
             
         Returns:
-            List of (key, distance) tuples, sorted by distance (lower = more similar)
+            SearchResults of (key, distance) pairs, sorted by distance (lower = more similar)
             
         Example:
             >>> query = [0.2, 0.4, 0.3, 0.7, 0.1]
@@ -275,19 +783,77 @@ class VectisClient:
             >>> for key, distance in results:
             ...     print(f"{key}: distance={distance:.4f}")
         """
-        vec = Vector(query)
+        vec = query if isinstance(query, Vector) else Vector(query)
+        values = vec.to_numpy()
         
-        response = self._request(
-            'POST',
-            '/api/vector/search',
-            json={'query': vec.to_list(), 'k': k}
-        )
+        mirror = self._mirror
+        if (mirror is not None and not force_remote
+                and len(mirror) >= k and mirror.dimension == len(vec)):
+            return SearchResults.from_pairs(mirror.search(values, k))
+        
+        cache_key = (values.tobytes(), k)
+        
+        cached = self._cache_lookup(self._search_cache, cache_key)
+        if cached is not None:
+            return cached.copy()
+        
+        response = None
+        if self.binary_vectors:
+            response = self._post_fvecs('vector_search', vec, {'k': k})
+        if response is None:
+            response = self._post_json('vector_search', {'query': values, 'k': k})
         
         if response.status_code != 200:
             raise VectisError(f"Vector search failed: {response.text}")
         
-        data = response.json()
-        return [(item['key'], item['distance']) for item in data.get('results', [])]
+        if self._is_fvecs(response):
+            results = _decode_search_results(_content(response))
+        else:
+            items = self._json(response).get('results', [])
+            results = SearchResults([item['key'] for item in items],
+                                    [item['distance'] for item in items])
+        self._cache_store(self._search_cache, cache_key, results)
+        return results.copy()
+    
+    @staticmethod
+    def rerank(query: Union[List[float], np.ndarray, Vector],
+               candidates: Dict[str, Union[List[float], np.ndarray, Vector]],
+               k: Optional[int] = None) -> SearchResults:
+        """
+        Rerank candidate vectors by exact Euclidean distance to a query.
+        
+        Candidates are stacked into one (K, d) matrix and scored with a single
+        matrix-vector product, without forming the (K, d) difference matrix.
+        
+        Args:
+            query: Query vector
+            candidates: Mapping of key to candidate vector, e.g. fetched with get_vector
+            k: Number of results to keep (default: all candidates)
+            
+        Returns:
+            SearchResults sorted by distance (lower = more similar)
+            
+        Raises:
+            ValueError: If a candidate's dimension differs from the query's
+            
+        Example:
+            >>> hits = client.search_similar(query, k=100)
+            >>> candidates = {key: client.get_vector(key) for key in hits.keys}
+            >>> top = client.rerank(query, candidates, k=10)
+        """
+        if not candidates:
+            return SearchResults()
+        
+        q = query if isinstance(query, Vector) else Vector(query)
+        keys = list(candidates)
+        cands = np.stack([
+            (v if isinstance(v, Vector) else Vector(v)).to_numpy()
+            for v in candidates.values()
+        ])
+        
+        dists = q.euclidean_distance_batch(cands)
+        order = np.argsort(dists, kind='stable')[:k]
+        return SearchResults([keys[i] for i in order], dists[order])
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -296,12 +862,12 @@ class VectisClient:
         Returns:
             Dictionary containing database statistics
         """
-        response = self._request('GET', '/api/stats')
+        response = self._request('GET', 'stats')
         
         if response.status_code != 200:
             raise VectisError(f"Failed to get stats: {response.text}")
         
-        return response.json()
+        return self._json(response)
     
     def health_check(self) -> Dict[str, Any]:
         """
@@ -310,15 +876,19 @@ class VectisClient:
         Returns:
             Dictionary containing health status information
         """
-        response = self._request('GET', '/api/health')
+        response = self._request('GET', 'health')
         
         if response.status_code != 200:
             raise VectisError(f"Health check failed: {response.text}")
         
-        return response.json()
+        return self._json(response)
     
     def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session and the batch thread pool."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
         self.session.close()
     
     def __enter__(self):
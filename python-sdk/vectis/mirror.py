@@ -0,0 +1,155 @@
+"""
+In-process mirror of vectors written through a VectisClient.
+
+Answers similarity queries locally so that warm, small collections do not pay
+an HTTP round-trip per search.
+"""
+
+import threading
+import numpy as np
+from typing import Optional, List, Tuple, Dict
+
+# HNSW acceleration for larger mirrors is optional (pip install vectis[mirror])
+try:
+    from usearch.index import Index, MetricKind
+except ImportError:
+    Index = None
+
+
+class LocalMirror:
+    """
+    Local cosine-similarity index over mirrored vectors.
+
+    Vectors are kept L2-normalized in a growable (N, d) float32 matrix. Up to
+    ``threshold`` vectors are searched by brute force with a single
+    matrix-vector product; above it a USearch HNSW index is built lazily when
+    the ``usearch`` package is installed.
+
+    Distances are cosine distances (1 - cosine similarity), lower = more similar.
+
+    Args:
+        threshold: Number of vectors above which the HNSW index is used (default: 1000)
+    """
+
+    def __init__(self, threshold: int = 1000):
+        self.threshold = threshold
+        self._rows: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._index = None
+        self._lock = threading.Lock()
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Dimension of the mirrored vectors, or None while empty."""
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    def __len__(self) -> int:
+        """Number of mirrored vectors."""
+        return len(self._keys)
+
+    def add(self, key: str, data: np.ndarray) -> None:
+        """
+        Insert or replace a vector.
+
+        Vectors whose dimension differs from the mirrored ones are ignored.
+
+        Args:
+            key: Vector key
+            data: float32 vector components
+        """
+        norm = np.linalg.norm(data)
+        row_data = data / norm if norm > 0 else data
+
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.empty((16, len(data)), dtype=np.float32)
+            elif len(data) != self._matrix.shape[1]:
+                return
+
+            row = self._rows.get(key)
+            if row is not None:
+                self._matrix[row] = row_data
+                if self._index is not None:
+                    self._index.remove(row)
+                    self._index.add(row, self._matrix[row])
+                return
+
+            row = len(self._keys)
+            if row == len(self._matrix):
+                grown = np.empty((2 * row, self._matrix.shape[1]), dtype=np.float32)
+                grown[:row] = self._matrix
+                self._matrix = grown
+            self._matrix[row] = row_data
+            self._rows[key] = row
+            self._keys.append(key)
+
+            if self._index is not None:
+                self._index.add(row, self._matrix[row])
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a vector if it is mirrored.
+
+        Args:
+            key: Vector key
+        """
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is None:
+                return
+
+            # Move the last row into the freed slot to keep the matrix dense
+            last = len(self._keys) - 1
+            if row != last:
+                moved = self._keys[last]
+                self._matrix[row] = self._matrix[last]
+                self._keys[row] = moved
+                self._rows[moved] = row
+            self._keys.pop()
+
+            # Keep the HNSW index in step with the row numbers instead of rebuilding it
+            if self._index is not None:
+                self._index.remove(row)
+                if row != last:
+                    self._index.remove(last)
+                    self._index.add(row, self._matrix[row])
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """
+        Find the k most similar mirrored vectors.
+
+        Args:
+            query: float32 query vector
+            k: Number of results to return
+
+        Returns:
+            List of (key, cosine distance) tuples, sorted by distance
+        """
+        norm = np.linalg.norm(query)
+        q = query / norm if norm > 0 else query
+
+        with self._lock:
+            n = len(self._keys)
+            k = min(k, n)
+            if k == 0:
+                return []
+
+            if n > self.threshold and Index is not None:
+                if self._index is None:
+                    self._index = Index(
+                        ndim=self._matrix.shape[1],
+                        metric=MetricKind.Cos,
+                        dtype='f32',
+                        connectivity=16,
+                        expansion_add=64
+                    )
+                    self._index.add(np.arange(n, dtype=np.uint64), self._matrix[:n])
+                matches = self._index.search(q, k)
+                return [(self._keys[int(row)], float(dist))
+                        for row, dist in zip(matches.keys, matches.distances)]
+
+            scores = self._matrix[:n] @ q
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self._keys[row], float(1.0 - scores[row])) for row in top]
@@ -0,0 +1,95 @@
+"""
+Search result container for Vectis Python SDK.
+"""
+
+import numpy as np
+from typing import List, Tuple, Iterator, Sequence, Union
+
+
+class SearchResults:
+    """
+    Compact, array-backed list of (key, distance) search results.
+
+    Results live in a single structured numpy array instead of one tuple, str
+    and float object per hit. Iterating still yields ``(key, distance)`` tuples,
+    so existing ``for key, distance in results`` code keeps working, while
+    ``keys`` and ``dists`` expose the columns as zero-copy arrays for
+    vectorized post-processing.
+
+    Args:
+        keys: Result keys, best match first
+        dists: Distances matching ``keys`` (lower = more similar)
+    """
+
+    __slots__ = ('_array',)
+
+    def __init__(self, keys: Sequence[str] = (), dists: Sequence[float] = ()):
+        width = max((len(k) for k in keys), default=1)
+        self._array = np.empty(len(keys), dtype=[('key', f'U{width}'), ('dist', 'f8')])
+        self._array['key'] = keys
+        self._array['dist'] = dists
+
+    @classmethod
+    def from_pairs(cls, pairs: Sequence[Tuple[str, float]]) -> 'SearchResults':
+        """
+        Build results from (key, distance) tuples.
+
+        Args:
+            pairs: Sequence of (key, distance) tuples
+
+        Returns:
+            SearchResults holding the same entries
+        """
+        if not pairs:
+            return cls()
+        keys, dists = zip(*pairs)
+        return cls(keys, dists)
+
+    @property
+    def keys(self) -> np.ndarray:
+        """Array of result keys."""
+        return self._array['key']
+
+    @property
+    def dists(self) -> np.ndarray:
+        """Array of float64 distances."""
+        return self._array['dist']
+
+    def to_list(self) -> List[Tuple[str, float]]:
+        """Convert results to a list of (key, distance) tuples."""
+        return list(zip(self._array['key'].tolist(), self._array['dist'].tolist()))
+
+    def copy(self) -> 'SearchResults':
+        """Return an independent copy of the results."""
+        results = SearchResults.__new__(SearchResults)
+        results._array = self._array.copy()
+        return results
+
+    def __len__(self) -> int:
+        """Number of results."""
+        return len(self._array)
+
+    def __iter__(self) -> Iterator[Tuple[str, float]]:
+        """Iterate over (key, distance) tuples."""
+        return iter(self.to_list())
+
+    def __getitem__(self, index: Union[int, slice]):
+        """Get a (key, distance) tuple, or a SearchResults for a slice."""
+        if isinstance(index, slice):
+            results = SearchResults.__new__(SearchResults)
+            results._array = self._array[index]
+            return results
+        row = self._array[index]
+        return str(row['key']), float(row['dist'])
+
+    def __eq__(self, other) -> bool:
+        """Compare with another SearchResults or a sequence of tuples."""
+        if isinstance(other, SearchResults):
+            return self.to_list() == other.to_list()
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == [tuple(item) for item in other]
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"SearchResults({self.to_list()!r})"
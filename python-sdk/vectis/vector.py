@@ -2,48 +2,238 @@
 Vector utilities for Vectis Python SDK.
 """
 
+import struct
 import numpy as np
 from typing import List, Union
 
+from . import _kernels
+
+
+# Storage dtypes and the 1-byte tags that identify quantized records on the wire
+DTYPES = {'f4': np.float32, 'f2': np.float16, 'i8': np.int8}
+_DTYPE_TAGS = {'f2': 0x02, 'i8': 0x03}
+_TAG_DTYPES = {tag: dtype for dtype, tag in _DTYPE_TAGS.items()}
+
 
 class Vector:
     """
     Vector representation for embeddings.
     
     Provides utilities for vector operations and conversions.
+    
+    Components are stored as float32 by default. ``dtype='f2'`` stores them as
+    float16 and ``dtype='i8'`` as symmetric int8 with a per-vector ``scale``,
+    halving or quartering memory and wire size. Arithmetic always runs on the
+    dequantized float32 values.
+    
+    A 1-D C-contiguous float32 array is wrapped without copying, so the vector
+    shares memory with it. Since the caller may still modify that array, the
+    norm of such a vector is not cached, and ``normalize(in_place=True)``
+    copies the data first instead of rescaling the caller's array.
     """
     
-    def __init__(self, data: Union[List[float], np.ndarray]):
+    __slots__ = ('data', 'dtype', 'scale', '_owned', '_cached_norm', '_normalized', '__weakref__')
+    
+    def __init__(self, data: Union[List[float], np.ndarray], dtype: str = 'f4'):
         """
         Initialize a vector.
         
         Args:
             data: List of floats or numpy array
+            dtype: Storage precision, one of 'f4' (float32), 'f2' (float16)
+                or 'i8' (int8 with scale)
         """
-        if isinstance(data, np.ndarray):
-            self.data = data.flatten().astype(np.float32)
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}, expected one of {list(DTYPES)}")
+        
+        if (isinstance(data, np.ndarray) and data.dtype == np.float32
+                and data.ndim == 1 and data.flags.c_contiguous):
+            values = data
+        elif isinstance(data, np.ndarray):
+            values = data.astype(np.float32, copy=False).ravel()
         else:
-            self.data = np.array(data, dtype=np.float32)
+            values = np.array(data, dtype=np.float32)
+        
+        self.dtype = dtype
+        self.scale = 1.0
+        self._cached_norm = None
+        self._normalized = False
+        if dtype == 'i8':
+            max_abs = float(np.max(np.abs(values))) if len(values) else 0.0
+            self.scale = max_abs / 127 if max_abs > 0 else 1.0
+            self.data = np.round(values / self.scale).astype(np.int8)
+        else:
+            self.data = values.astype(DTYPES[dtype], copy=False)
+        self._owned = not isinstance(data, np.ndarray) or not np.may_share_memory(self.data, data)
+    
+    def _values(self) -> np.ndarray:
+        """Return the components as float32, dequantizing if needed."""
+        if self.dtype == 'f4':
+            return self.data
+        if self.dtype == 'i8':
+            return self.data.astype(np.float32) * np.float32(self.scale)
+        return self.data.astype(np.float32)
+    
+    @classmethod
+    def _from_storage(cls, data: np.ndarray, dtype: str, scale: float = 1.0) -> 'Vector':
+        """Wrap already-encoded storage without re-quantizing."""
+        vec = cls.__new__(cls)
+        vec.data = data
+        vec.dtype = dtype
+        vec.scale = scale
+        vec._owned = True
+        vec._cached_norm = None
+        vec._normalized = False
+        return vec
+    
+    def norm(self) -> float:
+        """
+        Compute the L2 norm of the vector.
+        
+        The result is cached until the vector is modified through ``__setitem__``,
+        unless the vector shares memory with an array it did not copy.
+        
+        Returns:
+            L2 norm
+        """
+        if self._cached_norm is not None:
+            return self._cached_norm
+        norm = float(np.linalg.norm(self._values()))
+        if self._owned:
+            self._cached_norm = norm
+        return norm
     
     def to_list(self) -> List[float]:
         """Convert vector to Python list."""
-        return self.data.tolist()
+        return self._values().tolist()
     
     def to_numpy(self) -> np.ndarray:
-        """Convert vector to numpy array."""
-        return self.data
+        """Convert vector to a float32 numpy array."""
+        return self._values()
+    
+    def to_bytes(self) -> bytes:
+        """
+        Encode the vector for the binary wire format.
+        
+        float32 vectors are written as a plain .fvecs record (uint32 dimension
+        followed by the float32 components). Quantized vectors are prefixed
+        with a 1-byte dtype tag, and int8 vectors carry their float32 scale
+        after the dimension.
+        
+        Returns:
+            Little-endian encoded vector
+        """
+        dim = struct.pack('<I', len(self.data))
+        if self.dtype == 'f4':
+            return dim + self.data.astype('<f4', copy=False).tobytes()
+        
+        header = bytes([_DTYPE_TAGS[self.dtype]]) + dim
+        if self.dtype == 'i8':
+            header += struct.pack('<f', self.scale)
+            return header + self.data.tobytes()
+        return header + self.data.astype('<f2', copy=False).tobytes()
+    
+    @classmethod
+    def from_bytes(cls, buf: bytes) -> 'Vector':
+        """
+        Decode a vector produced by ``to_bytes``.
+        
+        Args:
+            buf: A plain .fvecs record or a dtype-tagged quantized record
+            
+        Returns:
+            Decoded vector, keeping the encoded storage dtype. float32 records
+            are wrapped without copying (see ``from_buffer``), so they are
+            read-only when ``buf`` is immutable (e.g. ``bytes``).
+        """
+        (dim,) = struct.unpack_from('<I', buf)
+        if len(buf) == 4 + 4 * dim:
+            return cls.from_buffer(memoryview(buf)[4:])
+        
+        dtype = _TAG_DTYPES.get(buf[0])
+        (dim,) = struct.unpack_from('<I', buf, 1)
+        if dtype == 'f2' and len(buf) == 5 + 2 * dim:
+            return cls._from_storage(np.frombuffer(buf, dtype='<f2', offset=5).astype(np.float16), 'f2')
+        if dtype == 'i8' and len(buf) == 9 + dim:
+            (scale,) = struct.unpack_from('<f', buf, 5)
+            return cls._from_storage(np.frombuffer(buf, dtype=np.int8, offset=9).copy(), 'i8', scale)
+        raise ValueError(f"Invalid vector record of {len(buf)} bytes")
+    
+    @classmethod
+    def from_buffer(cls, buf: bytes) -> 'Vector':
+        """
+        Wrap a buffer of raw float32 components without copying.
+        
+        The vector is read-only when ``buf`` is immutable (e.g. ``bytes``);
+        copy ``data`` before modifying it.
+        
+        Args:
+            buf: Buffer of native-endian float32 values
+            
+        Returns:
+            Vector viewing ``buf``
+        """
+        return cls(np.frombuffer(buf, dtype=np.float32))
     
-    def normalize(self) -> 'Vector':
+    @classmethod
+    def from_normalized_bytes(cls, buf: bytes) -> 'Vector':
+        """
+        Decode a vector that is known to already have unit length.
+        
+        The result is flagged as normalized without recomputing its norm, so
+        cosine similarity against other normalized vectors is a plain dot product.
+        Unlike ``from_bytes``, the components are copied out of ``buf``, so the
+        result is writable and unaffected by later changes to ``buf``.
+        
+        Args:
+            buf: Bytes produced by ``to_bytes`` on a normalized vector
+            
+        Returns:
+            Decoded, normalized vector
+        """
+        vec = cls.from_bytes(buf)
+        if not vec._owned:
+            vec.data = vec.data.copy()
+            vec._owned = True
+        vec._cached_norm = 1.0
+        vec._normalized = True
+        return vec
+    
+    @property
+    def normalized(self) -> bool:
+        """Whether the vector is known to have unit length."""
+        return self._normalized
+    
+    def normalize(self, in_place: bool = False) -> 'Vector':
         """
         Normalize the vector to unit length (L2 norm = 1).
         
+        Normalized vectors are flagged so that ``cosine_similarity`` between two
+        of them reduces to a single dot product. A vector sharing memory with
+        the caller's array copies it before rescaling in place.
+        
+        Args:
+            in_place: Rescale this vector instead of returning a new one
+            
         Returns:
-            Normalized vector
+            Normalized vector with the same storage dtype (``self`` if in_place)
         """
-        norm = np.linalg.norm(self.data)
+        if not in_place:
+            return Vector(self._values().copy(), dtype=self.dtype).normalize(in_place=True)
+        
+        if not self._owned:
+            self.data = self.data.copy()
+            self._owned = True
+        
+        norm = self.norm()
         if norm > 0:
-            return Vector(self.data / norm)
-        return Vector(self.data)
+            if self.dtype == 'i8':
+                self.scale /= norm
+            else:
+                self.data /= self.data.dtype.type(norm)
+            self._cached_norm = 1.0
+        self._normalized = norm > 0
+        return self
     
     def cosine_similarity(self, other: 'Vector') -> float:
         """
@@ -55,9 +245,12 @@ class Vector:
         Returns:
             Cosine similarity (-1 to 1, 1 = identical direction)
         """
-        dot_product = np.dot(self.data, other.data)
-        norm_self = np.linalg.norm(self.data)
-        norm_other = np.linalg.norm(other.data)
+        if self._normalized and other._normalized:
+            return float(self._values() @ other._values())
+        
+        dot_product = np.dot(self._values(), other._values())
+        norm_self = self.norm()
+        norm_other = other.norm()
         
         if norm_self == 0 or norm_other == 0:
             return 0.0
@@ -74,7 +267,7 @@ class Vector:
         Returns:
             Euclidean distance (L2 distance)
         """
-        return float(np.linalg.norm(self.data - other.data))
+        return float(np.linalg.norm(self._values() - other._values()))
     
     def dot_product(self, other: 'Vector') -> float:
         """
@@ -86,7 +279,67 @@ class Vector:
         Returns:
             Dot product
         """
-        return float(np.dot(self.data, other.data))
+        return float(np.dot(self._values(), other._values()))
+    
+    def _check_matrix(self, mat: np.ndarray) -> np.ndarray:
+        """Convert ``mat`` to float32 and check it is (N, d) with this vector's d."""
+        mat = np.asarray(mat, dtype=np.float32)
+        if mat.ndim != 2 or mat.shape[1] != len(self):
+            raise ValueError(f"Expected a matrix of shape (N, {len(self)}), got {mat.shape}")
+        return mat
+    
+    def cosine_similarity_batch(self, mat: np.ndarray) -> np.ndarray:
+        """
+        Compute cosine similarity against every row of a matrix.
+        
+        Small dimensions use a compiled Numba kernel when numba is installed.
+        
+        Args:
+            mat: Array of shape (N, d) holding N candidate vectors
+            
+        Returns:
+            Array of N cosine similarities
+            
+        Raises:
+            ValueError: If ``mat`` is not of shape (N, d)
+        """
+        mat = self._check_matrix(mat)
+        kernels = _kernels.load() if mat.shape[1] < _kernels.MAX_DIM else None
+        if kernels is not None:
+            out = np.empty(mat.shape[0], dtype=np.float32)
+            kernels[0](self._values(), np.ascontiguousarray(mat), out)
+            return out
+        
+        dots = mat @ self._values()
+        mat_norms = np.linalg.norm(mat, axis=1)
+        return dots / (mat_norms * self.norm() + 1e-12)
+    
+    def euclidean_distance_batch(self, mat: np.ndarray) -> np.ndarray:
+        """
+        Compute Euclidean distance to every row of a matrix.
+        
+        Uses ||a||^2 + ||b||^2 - 2 a.b so no (N, d) difference matrix is formed.
+        Small dimensions use a compiled Numba kernel when numba is installed.
+        
+        Args:
+            mat: Array of shape (N, d) holding N candidate vectors
+            
+        Returns:
+            Array of N Euclidean distances
+            
+        Raises:
+            ValueError: If ``mat`` is not of shape (N, d)
+        """
+        mat = self._check_matrix(mat)
+        kernels = _kernels.load() if mat.shape[1] < _kernels.MAX_DIM else None
+        if kernels is not None:
+            out = np.empty(mat.shape[0], dtype=np.float32)
+            kernels[1](self._values(), np.ascontiguousarray(mat), out)
+            return out
+        
+        mat_sq = np.einsum('ij,ij->i', mat, mat)
+        sq = mat_sq + self.norm() ** 2 - 2 * (mat @ self._values())
+        return np.sqrt(np.maximum(sq, 0))
     
     def __len__(self) -> int:
         """Get vector dimension."""
@@ -94,12 +347,23 @@ class Vector:
     
     def __repr__(self) -> str:
         """String representation."""
+        if self.dtype != 'f4':
+            return f"Vector(dim={len(self)}, dtype={self.dtype}, data={self._values()[:5]}...)"
         return f"Vector(dim={len(self)}, data={self.data[:5]}...)"
     
     def __getitem__(self, index):
-        """Get element at index."""
-        return self.data[index]
+        """Get element at index, dequantizing only the selected components."""
+        if self.dtype == 'f4':
+            return self.data[index]
+        values = self.data[index].astype(np.float32)
+        if self.dtype == 'i8':
+            values *= np.float32(self.scale)
+        return values
     
     def __setitem__(self, index, value):
         """Set element at index."""
+        if self.dtype == 'i8':
+            value = np.clip(np.round(np.asarray(value, dtype=np.float32) / self.scale), -127, 127)
         self.data[index] = value
+        self._cached_norm = None
+        self._normalized = False
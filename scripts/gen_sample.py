@@ -0,0 +1,65 @@
+"""
+Generate a sample SIFT-style .fvecs dataset for Vectis.
+
+Each record is a little-endian int32 dimension followed by that many float32
+components, matching the layout read by core_engine::vector::SiftParser and
+the /api/vector/bulk_load_file endpoint.
+
+Usage:
+    python scripts/gen_sample.py [output.fvecs] [num_vectors] [dim] [seed]
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+from numpy.random import SeedSequence, default_rng
+
+# Rows generated per task; bounds the temporary buffer each worker allocates
+CHUNK_ROWS = 65536
+
+
+def generate_fvecs(path: str, num_vectors: int = 100, dim: int = 128,
+                   seed: Optional[int] = None) -> None:
+    """
+    Write ``num_vectors`` random vectors of dimension ``dim`` to ``path``.
+
+    Rows are filled in parallel chunks, each with its own independent
+    generator spawned from ``seed``, so the output for a given seed does not
+    depend on the number of threads.
+
+    Args:
+        path: Output .fvecs file path
+        num_vectors: Number of vectors to generate
+        dim: Dimension of each vector
+        seed: Seed for reproducible output (default: fresh entropy)
+    """
+    # One row per record: [dim as int32, dim float32 components]
+    buf = np.empty((num_vectors, dim + 1), dtype='<f4')
+    buf[:, 0].view('<i4')[:] = dim
+
+    starts = range(0, num_vectors, CHUNK_ROWS)
+    seeds = SeedSequence(seed).spawn(len(starts))
+
+    def fill(start: int, chunk_seed: SeedSequence) -> None:
+        stop = min(start + CHUNK_ROWS, num_vectors)
+        # NumPy releases the GIL while drawing, so chunks run concurrently
+        buf[start:stop, 1:] = default_rng(chunk_seed).random((stop - start, dim), dtype=np.float32)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        list(pool.map(fill, starts, seeds))
+
+    with open(path, 'wb') as f:
+        buf.tofile(f)
+
+
+if __name__ == '__main__':
+    out = sys.argv[1] if len(sys.argv) > 1 else 'sample.fvecs'
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    d = int(sys.argv[3]) if len(sys.argv) > 3 else 128
+    s = int(sys.argv[4]) if len(sys.argv) > 4 else None
+
+    generate_fvecs(out, n, d, s)
+    print(f"Wrote {n} vectors of dimension {d} to {out}")